@@ -3,16 +3,20 @@ from poker import *
 import random
 import os
 import pickle
+import sys
 
 if __name__ == "__main__":
     random.seed(127)
 
-    reinforcement_player = Player(strategy=Reinforcement(), money=40)
+    reinforcement_player = Player(strategy=Reinforcement(batch_size=256), money=40)
 
-    filename = "Reinforcement_map_6000.pkl"
+    filename = "Reinforcement_map.pkl"
     if os.path.isfile(filename):
         with open(filename, "rb") as f:  # open a text file
-            reinforcement_player.strategy.value_map = pickle.load(f)
+            (
+                reinforcement_player.strategy.value_map,
+                reinforcement_player.strategy.visit_counts,
+            ) = pickle.load(f)
 
     players = (
         # Player(strategy=RandomStrategy(aggression=0.2), money=20),
@@ -28,10 +32,10 @@ if __name__ == "__main__":
     table2 = Table.construct_withPlayers(players)
 
     # Train reinforcement player.
+    pocket_ace = Reinforcement.pocket_key(Card.Face.ACE, Card.Face.ACE)
+    deuce = Reinforcement.pocket_key(Card.Face.TWO, Card.Face.SEVEN)
     try:
         for iter in range(1_000_000):
-            pocket_ace = (Card.Face.ACE, Card.Face.ACE)
-            deuce = (Card.Face.TWO, Card.Face.SEVEN)
             # print(reinforcement_player.strategy.value_map)
             table2.reset()
             table2.state.players[1].strategy = reinforcement_player.strategy
@@ -39,23 +43,43 @@ if __name__ == "__main__":
                 table2.step()
             reinforcement_player.strategy = table2.state.players[1].strategy
 
-            print(
-                "Training reinforcement_player iteration:",
-                iter,
-                "Pocket Ace:",
-                reinforcement_player.strategy.value_map[pocket_ace],
-                "Deuce :",
-                reinforcement_player.strategy.value_map[deuce],
-                "Winner:",
-                table2.getWinner().strategy.__class__.__name__,
-            )
+            # Report progress every 1000 iterations, one write per report.
             if iter % 1000 == 0:
+                reinforcement_player.strategy.update()
+                value_map = reinforcement_player.strategy.value_map
+                visit_counts = reinforcement_player.strategy.visit_counts
+                sys.stdout.write(
+                    f"Training reinforcement_player iteration: {iter}"
+                    f" Pocket Ace: {value_map[pocket_ace]} ({visit_counts[pocket_ace]})"
+                    f" Deuce : {value_map[deuce]} ({visit_counts[deuce]})"
+                    f" Winner: {table2.getWinner().strategy.__class__.__name__}\n"
+                )
+            if iter % 10_000 == 0:
                 with open(
                     f"Reinforcement_map_{iter}.pkl", "wb"
                 ) as f:  # open a text file
-                    pickle.dump(reinforcement_player.strategy.value_map, f)
-    except:
+                    pickle.dump(
+                        (
+                            reinforcement_player.strategy.value_map,
+                            reinforcement_player.strategy.visit_counts,
+                        ),
+                        f,
+                        protocol=pickle.HIGHEST_PROTOCOL,
+                    )
+    except KeyboardInterrupt:
         pass
+    finally:
+        # Always keep the latest value_map, training resumes from it.
+        reinforcement_player.strategy.update()
+        with open(filename, "wb") as f:
+            pickle.dump(
+                (
+                    reinforcement_player.strategy.value_map,
+                    reinforcement_player.strategy.visit_counts,
+                ),
+                f,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
 
     # Create a table with window from the init state and some players.
     # table = TableWithWindow(players=players, loglevel=logging.WARNING)
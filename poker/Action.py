@@ -3,9 +3,10 @@ from poker.Money import Money
 
 from dataclasses import dataclass
 from enum import Enum
+from typing import ClassVar
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Action:
 
     class Type(Enum):
@@ -19,7 +20,15 @@ class Action:
     type: Type
     amount: Money = 0
 
+    # Shared instances of the most common actions, frozen like every Action.
+    FOLD_0: ClassVar["Action"]
+    CHECK_0: ClassVar["Action"]
+
     def __repr__(self) -> str:
         if self.amount > 0:
             return f"{self.type.name} with {self.amount}"
         return f"{self.type.name}"
+
+
+Action.FOLD_0 = Action(Action.Type.FOLD, 0)
+Action.CHECK_0 = Action(Action.Type.CHECK, 0)
@@ -10,18 +10,55 @@ from poker.Table import Table
 from poker.TableState import TableState
 from poker.Player import Player
 
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Dict, List, Optional, Tuple
+
+import pickle
+import random
+import sys
+
+
+def _simulate_one(
+    init_blob: bytes, seed: int
+) -> Tuple[Dict[int, List[int]], str, int]:
+    """
+    Simulates one game from the pickled init_state until a single player remains.
+
+    Returns:
+        The money history per player index, the winning strategy name and the
+        number of rounds played.
+    """
+    init_state: TableState = pickle.loads(init_blob)
+    money_time = {idx: [p.money] for idx, p in enumerate(init_state.players)}
+
+    def record_money(table: Table) -> None:
+        for idx, p in enumerate(table.state.players):
+            money_time[idx].append(p.money)
+
+    table: Table = Table.simulate(init_blob, seed, on_round=record_money)
+    winner: Player = table.getWinner()
+    return money_time, winner.strategy.__class__.__name__, table.round_counter
+
 
 def make_picture_money_over_rounds(
-    players: tuple[Player, ...], n_pictures: int = 1, folder: str = "SampleRuns"
+    players: tuple[Player, ...],
+    n_pictures: int = 1,
+    folder: str = "SampleRuns",
+    max_workers: Optional[int] = None,
 ) -> None:
     """
     Simulates a game between players and generates plots showing how each player's
     money changes over time, for a specified number of runs.
 
+    The games are independent and simulated in parallel worker processes, the
+    plots are rendered afterwards in this process.
+
     Args:
         players (List[Player]): A list of Player instances with assigned strategies and starting money.
         n_pictures (int): Number of simulation plots to generate. Each is a separate game.
         folder (str): Folder path to save the generated images.
+        max_workers (Optional[int]): Number of worker processes, defaults to the CPU count.
 
     Returns:
         None. Saves plots as JPEG images in the specified folder.
@@ -34,34 +71,32 @@ def make_picture_money_over_rounds(
     # Ensure the output directory exists
     os.makedirs(folder, exist_ok=True)
 
-    table: Table = Table.construct_withPlayers(players)
-
-    for i in range(n_pictures):
-        money_time = {idx: [p.money] for idx, p in enumerate(players)}
-
-        table.reset()
-        while not table.done():
-            table.step()
-            while table.round_underway() and not table.done():
-                table.step()
-
-            for idx, p in enumerate(table.state.players):
-                money_time[idx].append(p.money)
+    # Draw the seeds here so the games follow the caller's random state.
+    seeds = [random.getrandbits(32) for _ in range(n_pictures)]
+    init_blob = pickle.dumps(
+        TableState.new_game(players), protocol=pickle.HIGHEST_PROTOCOL
+    )
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        results = list(
+            executor.map(_simulate_one, repeat(init_blob, n_pictures), seeds)
+        )
 
-        winner: Player = table.getWinner()
-        print(
-            f"Table {i+1} has winning strategy {winner.strategy.__class__.__name__} after {table.round_counter} rounds"
+    # One figure is reused for every plot.
+    fig, ax = plt.subplots(figsize=(10, 6))  # type: ignore
+    for i, (money_time, winner_name, rounds) in enumerate(results):
+        sys.stdout.write(
+            f"Table {i+1} has winning strategy {winner_name} after {rounds} rounds\n"
         )
-        plt.figure(figsize=(10, 6))  # type: ignore
+        ax.clear()
         for idx, money_history in money_time.items():
             strategy_name = players[idx].strategy.__class__.__name__
-            plt.plot(money_history, label=f"Player {idx} ({strategy_name})")  # type: ignore
-
-        plt.title("Player Money over rounds")  # type: ignore
-        plt.xlabel("Round")  # type: ignore
-        plt.ylabel("Money")  # type: ignore
-        plt.legend(title="Players")  # type: ignore
-        plt.grid(True)  # type: ignore
-        plt.tight_layout()
-        plt.savefig(f"{folder}/money_over_rounds_{i+1}.jpeg")  # type: ignore
-        plt.close()
+            ax.plot(money_history, label=f"Player {idx} ({strategy_name})")  # type: ignore
+
+        ax.set_title("Player Money over rounds")  # type: ignore
+        ax.set_xlabel("Round")  # type: ignore
+        ax.set_ylabel("Money")  # type: ignore
+        ax.legend(title="Players")  # type: ignore
+        ax.grid(True)  # type: ignore
+        fig.tight_layout()
+        fig.savefig(f"{folder}/money_over_rounds_{i+1}.jpeg")  # type: ignore
+    plt.close(fig)
@@ -1,8 +1,12 @@
 from enum import Enum
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Callable, Tuple
 
+# One prime per face (TWO..ACE), the product identifies a multiset of faces.
+FACE_PRIMES: Tuple[int, ...] = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class Card:
 
     class Suit(Enum):
@@ -28,6 +32,33 @@ class Card:
 
     suit: Suit
     face: Face
+    # Packed 0..51 integer of the card: (suit - 1) * 13 + face - 2.
+    code: int = field(init=False, repr=False, compare=False)
+    # FACE_PRIMES of the face, hands multiply them like Cactus Kev's evaluator.
+    prime: int = field(init=False, repr=False, compare=False)
+    # A 3-bit counter per suit, summed over a hand it counts the cards per suit.
+    suit_key: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Frozen dataclass, set the derived fields through object.
+        object.__setattr__(
+            self, "code", (self.suit.value - 1) * 13 + self.face.value - 2
+        )
+        object.__setattr__(self, "prime", FACE_PRIMES[self.face.value - 2])
+        object.__setattr__(self, "suit_key", 1 << 3 * (self.suit.value - 1))
+
+    def __hash__(self) -> int:
+        # Equal cards share suit and face, so they share their code.
+        return self.code
+
+    def __reduce__(self) -> Tuple[Callable[[int], "Card"], Tuple[int]]:
+        # Copies and unpickled cards resolve to the interned card of the code.
+        return Card.from_code, (self.code,)
+
+    @classmethod
+    def from_code(cls, code: int) -> "Card":
+        """Returns the interned card belonging to a packed 0..51 integer."""
+        return ALL_CARDS[code]
 
     @classmethod
     def color(cls, card: "Card") -> str:
@@ -41,5 +72,8 @@ class Card:
 
         return f"{val}{self.suit.name}"
 
-    def __hash__(self):
-        return self.face.value
\ No newline at end of file
+
+# The 52 interned cards, ALL_CARDS[card.code] is card.
+ALL_CARDS: Tuple[Card, ...] = tuple(
+    Card(suit, face) for suit in Card.Suit for face in Card.Face
+)
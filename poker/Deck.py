@@ -1,43 +1,68 @@
-from poker.Card import Card
+from poker.Card import ALL_CARDS, Card
 
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 import random
 
+# Codes of a full deck, ALL_CARDS holds the matching Card objects.
+_CODES: Tuple[int, ...] = tuple(range(52))
+# An unshuffled deck has the highest code on top.
+_UNSHUFFLED: Tuple[int, ...] = _CODES[::-1]
+
 
 class Deck:
 
-    def __init__(self, shuffle: bool = True):
-        self._original_deck: List[Card] = [
-            Card(suit, face) for suit in Card.Suit for face in Card.Face
-        ]
-        self._cards: List[Card] = self._original_deck.copy()
-        if shuffle:
-            self.shuffle()
+    def __init__(self, shuffle: bool = True) -> None:
+        # A permutation of the codes, the first _top of them have been dealt.
+        # Shuffling is done one card at a time, as the cards are dealt.
+        self._codes: List[int] = list(_CODES if shuffle else _UNSHUFFLED)
+        self._top = 0
+        self._shuffled = shuffle
 
     def shuffle(self) -> None:
-        random.shuffle(self._cards)
+        self._shuffled = True
 
     def draw(self) -> Optional[Card]:
         """Draw a card from the top of the deck. Returns None if deck is empty."""
-        if self._cards:
-            return self._cards.pop()
-        return None
+        if self._top == 52:
+            return None
+        return self.sample()
 
     def sample(self) -> Card:
-        """Randomly sample a card. If replace=False, the card is removed from the deck."""
-        assert self._cards, "Deck is empty! No sample possible!"
-        card: Card = self._cards.pop()
-        return card
+        """Take the top card, a random one if shuffled. It is removed from the deck."""
+        codes = self._codes
+        top = self._top
+        assert top < 52, "Deck is empty! No sample possible!"
+        if self._shuffled:
+            # Swap a random remaining card to the top, one Fisher-Yates step.
+            pick = top + int(random.random() * (52 - top))
+            codes[top], codes[pick] = codes[pick], codes[top]
+        self._top = top + 1
+        return ALL_CARDS[codes[top]]
+
+    def deal(self, k: int) -> List[Card]:
+        """Sample k cards at once. The cards are removed from the deck."""
+        assert k <= 52 - self._top, f"Deck holds {len(self)} cards, cannot deal {k}!"
+        # The sample steps inlined, the dealt codes end up in codes[top:end].
+        codes = self._codes
+        top = self._top
+        end = top + k
+        if self._shuffled:
+            rand = random.random
+            for pos in range(top, end):
+                pick = pos + int(rand() * (52 - pos))
+                codes[pos], codes[pick] = codes[pick], codes[pos]
+        self._top = end
+        return [ALL_CARDS[code] for code in codes[top:end]]
 
     def reset(self, shuffle: bool = True) -> None:
-        """Reset the deck to full 52 cards."""
-        self._cards = self._original_deck.copy()
-        if shuffle:
-            self.shuffle()
+        """Reset the deck to full 52 cards, in the order of a new Deck."""
+        self._codes[:] = _CODES if shuffle else _UNSHUFFLED
+        self._top = 0
+        self._shuffled = shuffle
 
     def __len__(self) -> int:
-        return len(self._cards)
+        return 52 - self._top
 
-    def __repr__(self):
+    def __repr__(self) -> str:
         return f"<Deck with {len(self)} cards>"
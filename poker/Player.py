@@ -6,7 +6,7 @@ from dataclasses import dataclass, field
 from typing import Tuple
 
 
-@dataclass
+@dataclass(slots=True)
 class Player:
     money: Money
     strategy: Strategy
@@ -17,3 +17,11 @@ class Player:
     all_in: bool = False
     bet: "Money" = 0  # Money put forward by the player this round.
 
+    def clone(self) -> "Player":
+        """Copy of the player, sharing its strategy.
+
+        The strategy is the live object of the player, copy it before changing it."""
+        return Player(
+            self.money, self.strategy, self.cards, self.folded, self.all_in, self.bet
+        )
+
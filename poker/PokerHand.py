@@ -1,12 +1,12 @@
-from poker.Card import Card
+from poker.Card import Card, FACE_PRIMES
 from poker.Score import Score
 from poker.Deck import Deck
 
-from typing import Tuple, Counter
+from typing import Dict, List, Optional, Tuple
 from enum import Enum
 
 from functools import total_ordering
-from itertools import combinations
+from itertools import combinations, combinations_with_replacement
 
 
 @total_ordering
@@ -44,147 +44,234 @@ class PokerHand:
         return f"PokerHand {self.tier.name} ({self.score}) {self.cards}"
 
     @classmethod
-    def random(cls):
+    def random(cls) -> "PokerHand":
         """Constructs a random pokerhand."""
         deck: Deck = Deck(shuffle=True)
-        cards = (
-            deck.sample(),
-            deck.sample(),
-            deck.sample(),
-            deck.sample(),
-            deck.sample(),
-        )
-        return PokerHand(cards)
+        return PokerHand(tuple(deck.deal(5)))
 
     @classmethod
-    def best(cls, cards: Tuple[Card, ...]):
-        """Constructs the best Pokerhand out of the available cards."""
-        assert len(cards) >= 5, "PokerHand consists of 5 cards!"
-        best = max((PokerHand(combo) for combo in combinations(cards, 5)))
-        return best
+    def best(
+        cls, cards: Tuple[Card, ...], score: Optional[Score] = None
+    ) -> "PokerHand":
+        """Constructs the best Pokerhand out of the available cards.
+
+        A score already evaluated for the same cards is reused, it picks the
+        first combination of 5 cards that reaches it."""
+        assert 5 <= len(cards) <= 7, "Best PokerHand is taken out of 5 to 7 cards!"
+        if score is None:
+            score = PokerHand.evaluate(cards)
+        hands = (PokerHand(combo) for combo in combinations(cards, 5))
+        return next(hand for hand in hands if hand.score == score)
+
+    @staticmethod
+    def evaluate(cards: Tuple[Card, ...]) -> Score:
+        """Scores the best 5-card Pokerhand out of the available cards."""
+        assert 5 <= len(cards) <= 7, "Best PokerHand is taken out of 5 to 7 cards!"
+
+        # Every suit owns 13 bits of the card mask.
+        mask = 0
+        for card in cards:
+            mask |= 1 << card.code
+        return _evaluate_mask(mask)
+
+    @staticmethod
+    def evaluate_mask(mask: int) -> Score:
+        """Scores the best 5-card Pokerhand in a card mask, bit Card.code per card."""
+        assert 5 <= mask.bit_count() <= 7, "Best PokerHand takes 5 to 7 cards!"
+        return _evaluate_mask(mask)
+
+    @staticmethod
+    def best7(mask: int, product: int, suits: int) -> Score:
+        """Scores the best 5-card Pokerhand in a card mask of 5 to 7 cards.
+
+        Takes the product of the Card.prime and the sum of the Card.suit_key of
+        the same cards, these pick the flush or non-flush lookup directly."""
+        assert 5 <= mask.bit_count() <= 7, "Best PokerHand takes 5 to 7 cards!"
+        shift = _FLUSH_SHIFT[suits]
+        if shift < 0:
+            return _NONFLUSH_LOOKUP[product]
+        return _FLUSH_LOOKUP[(mask >> shift) & 0x1FFF]
 
     def _evaluate_score(self) -> Tuple[Tier, Score]:
         """Scores the current Pokerhand."""
         assert len(self.cards) == 5, "Pokerhands consists of exactly 5 cards!"
 
-        cards = list(self.cards)
-        cards.sort(key=lambda x: x.face.value, reverse=True)
-        faces = [card.face.value for card in cards]
-        suits = [card.suit for card in cards]
-        face_counter = Counter(faces)
-        face_counts = sorted(face_counter.items(), key=lambda x: (-x[1], -x[0]))
-        unique_faces = sorted(set(faces), reverse=True)
-
-        # print(face_counts)
-
-        def is_flush():
-            return len(set(suits)) == 1
-
-        def is_straight():
-            sorted_faces = sorted(unique_faces)
-            if len(sorted_faces) != 5:
-                return False
-            if sorted_faces == [2, 3, 4, 5, 14]:  # Wheel
-                return True
-            return sorted_faces[4] - sorted_faces[0] == 4
-
-        flush = is_flush()
-        straight = is_straight()
-
-        # TIER 10: ROYAL FLUSH
-        if flush and faces == [14, 13, 12, 11, 10]:
-            return (
-                PokerHand.Tier.ROYAL_FLUSH,
-                PokerHand.Tier.ROYAL_FLUSH.value * 1_000_000,
-            )
-
-        # TIER 9: STRAIGHT FLUSH
-        if flush and straight:
-            high_card = 5 if set(faces) == {14, 2, 3, 4, 5} else max(unique_faces)
-            return (
-                PokerHand.Tier.STRAIGHT_FLUSH,
-                PokerHand.Tier.STRAIGHT_FLUSH.value * 1_000_000 + high_card,
-            )
-
-        # TIER 8: FOUR OF A KIND
-        if face_counts[0][1] == 4:
-            quad = face_counts[0][0]
-            kicker = face_counts[1][0]
-            return (
-                PokerHand.Tier.FOUR_OF_A_KIND,
-                PokerHand.Tier.FOUR_OF_A_KIND.value * 1_000_000 + quad * 100 + kicker,
-            )
-
-        # TIER 7: FULL HOUSE
-        if face_counts[0][1] == 3 and face_counts[1][1] == 2:
-            trips = face_counts[0][0]
-            pair = face_counts[1][0]
-            return (
-                PokerHand.Tier.FULL_HOUSE,
-                PokerHand.Tier.FULL_HOUSE.value * 1_000_000 + trips * 100 + pair,
-            )
-
-        # TIER 6: FLUSH
-        if flush:
-            return (
-                PokerHand.Tier.FLUSH,
-                PokerHand.Tier.FLUSH.value * 1_000_000 + max(faces),
-            )
+        c0, c1, c2, c3, c4 = self.cards
+        score = _evaluate_mask(
+            1 << c0.code | 1 << c1.code | 1 << c2.code | 1 << c3.code | 1 << c4.code
+        )
+        return PokerHand.Tier(score // 1_000_000), score
+
+
+def _evaluate_flush(r0: int, r1: int, r2: int, r3: int, r4: int) -> Score:
+    """Scores 5 suited faces sorted descending, the tier is encoded in the millions.
 
+    Only used to fill the lookup tables, hands are scored through _evaluate_mask."""
+    straight = r0 - r4 == 4
+    # Wheel: A-5-4-3-2, the ace plays low.
+    if r0 == 14 and r1 == 5:
+        straight = True
+        r0 = 5
+
+    # TIER 10: ROYAL FLUSH
+    if straight and r4 == 10:
+        return PokerHand.Tier.ROYAL_FLUSH.value * 1_000_000
+
+    # TIER 9: STRAIGHT FLUSH
+    if straight:
+        return PokerHand.Tier.STRAIGHT_FLUSH.value * 1_000_000 + r0
+
+    # TIER 6: FLUSH
+    return PokerHand.Tier.FLUSH.value * 1_000_000 + r0
+
+
+def _evaluate_nonflush(r0: int, r1: int, r2: int, r3: int, r4: int) -> Score:
+    """Scores 5 offsuit faces sorted descending, the tier is encoded in the millions.
+
+    Only used to fill the lookup tables, hands are scored through _evaluate_mask."""
+
+    # Equal neighbours in the sorted faces determine the pair pattern.
+    eq01 = r0 == r1
+    eq12 = r1 == r2
+    eq23 = r2 == r3
+    eq34 = r3 == r4
+
+    if not (eq01 or eq12 or eq23 or eq34):
         # TIER 5: STRAIGHT
-        if straight:
-            high_card = 5 if set(faces) == {14, 2, 3, 4, 5} else max(unique_faces)
-            return (
-                PokerHand.Tier.STRAIGHT,
-                PokerHand.Tier.STRAIGHT.value * 1_000_000 + high_card,
-            )
-
-        # TIER 4: THREE OF A KIND
-        if face_counts[0][1] == 3:
-            trips = face_counts[0][0]
-            kickers = [f for f in faces if f != trips]
-            kickers.sort(reverse=True)
-            return (
-                PokerHand.Tier.THREE_OF_A_KIND,
-                PokerHand.Tier.THREE_OF_A_KIND.value * 1_000_000
-                + trips * 10_000
-                + kickers[0] * 1000
-                + kickers[1] * 100,
-            )
-
-        # TIER 3: TWO PAIR
-        if face_counts[0][1] == 2 and face_counts[1][1] == 2:
-            high_pair = max(face_counts[0][0], face_counts[1][0])
-            low_pair = min(face_counts[0][0], face_counts[1][0])
-            kicker = [f for f in faces if f != high_pair and f != low_pair][0]
-            return (
-                PokerHand.Tier.TWO_PAIR,
-                PokerHand.Tier.TWO_PAIR.value * 1_000_000
-                + high_pair * 10_000
-                + low_pair * 100
-                + kicker,
-            )
-
-        # TIER 2: ONE PAIR
-        if face_counts[0][1] == 2:
-            pair = face_counts[0][0]
-            kickers = [f for f in faces if f != pair]
-            kickers.sort(reverse=True)
-            return (
-                PokerHand.Tier.ONE_PAIR,
-                PokerHand.Tier.ONE_PAIR.value * 1_000_000
-                + pair * 10_000
-                + kickers[0] * 1000
-                + kickers[1] * 100
-                + kickers[2] * 10,
-            )
+        if r0 - r4 == 4:
+            return PokerHand.Tier.STRAIGHT.value * 1_000_000 + r0
+        # Wheel: A-5-4-3-2, the ace plays low.
+        if r0 == 14 and r1 == 5:
+            return PokerHand.Tier.STRAIGHT.value * 1_000_000 + 5
 
         # TIER 1: HIGH CARD
+        return r0 * 10000 + r1 * 1000 + r2 * 100 + r3 * 10 + r4
+
+    # TIER 8: FOUR OF A KIND
+    if eq12 and eq23 and (eq01 or eq34):
+        quad, kicker = (r0, r4) if eq01 else (r4, r0)
+        return PokerHand.Tier.FOUR_OF_A_KIND.value * 1_000_000 + quad * 100 + kicker
+
+    # TIER 7: FULL HOUSE
+    if eq01 and eq34 and (eq12 or eq23):
+        trips, pair = (r0, r4) if eq12 else (r4, r0)
+        return PokerHand.Tier.FULL_HOUSE.value * 1_000_000 + trips * 100 + pair
+
+    # TIER 4: THREE OF A KIND
+    if (eq01 and eq12) or (eq12 and eq23) or (eq23 and eq34):
+        if eq01:
+            trips, k0, k1 = r0, r3, r4
+        elif eq34:
+            trips, k0, k1 = r2, r0, r1
+        else:
+            trips, k0, k1 = r1, r0, r4
+        return (
+            PokerHand.Tier.THREE_OF_A_KIND.value * 1_000_000
+            + trips * 10_000
+            + k0 * 1000
+            + k1 * 100
+        )
+
+    # TIER 3: TWO PAIR
+    if (eq01 + eq12 + eq23 + eq34) == 2:
+        if eq01 and eq23:
+            high_pair, low_pair, kicker = r0, r2, r4
+        elif eq01:
+            high_pair, low_pair, kicker = r0, r3, r2
+        else:
+            high_pair, low_pair, kicker = r1, r3, r0
         return (
-            PokerHand.Tier.HIGH_CARD,
-            faces[0] * 10000
-            + faces[1] * 1000
-            + faces[2] * 100
-            + faces[3] * 10
-            + faces[4],
+            PokerHand.Tier.TWO_PAIR.value * 1_000_000
+            + high_pair * 10_000
+            + low_pair * 100
+            + kicker
         )
+
+    # TIER 2: ONE PAIR
+    if eq01:
+        pair, k0, k1, k2 = r0, r2, r3, r4
+    elif eq12:
+        pair, k0, k1, k2 = r1, r0, r3, r4
+    elif eq23:
+        pair, k0, k1, k2 = r2, r0, r1, r4
+    else:
+        pair, k0, k1, k2 = r3, r0, r1, r2
+    return (
+        PokerHand.Tier.ONE_PAIR.value * 1_000_000
+        + pair * 10_000
+        + k0 * 1000
+        + k1 * 100
+        + k2 * 10
+    )
+
+
+def _evaluate_mask(mask: int) -> Score:
+    """Scores the best 5-card hand in a 52-bit card mask of 5 to 7 cards."""
+
+    # At most one suit can hold five cards, and then a flush is the best hand.
+    for shift in (0, 13, 26, 39):
+        suited = (mask >> shift) & 0x1FFF
+        if suited.bit_count() >= 5:
+            return _FLUSH_LOOKUP[suited]
+
+    # The product of the face primes identifies the multiset of 5 to 7 faces.
+    product = 1
+    while mask:
+        low = mask & -mask
+        product *= FACE_PRIMES[(low.bit_length() - 1) % 13]
+        mask ^= low
+    return _NONFLUSH_LOOKUP[product]
+
+
+def _build_flush_lookup() -> List[Score]:
+    """Best flush score for every 13-bit face mask holding 5 to 7 faces."""
+    lookup: List[Score] = [0] * (1 << 13)
+    for mask in range(1 << 13):
+        if not 5 <= mask.bit_count() <= 7:
+            continue
+        faces = [face + 2 for face in range(12, -1, -1) if mask >> face & 1]
+        lookup[mask] = max(
+            _evaluate_flush(*combo) for combo in combinations(faces, 5)
+        )
+    return lookup
+
+
+def _build_nonflush_lookup() -> Dict[int, Score]:
+    """Best score of every 5- to 7-face multiset, keyed by its prime product."""
+    lookup: Dict[int, Score] = {}
+    # Descending faces, so every multiset comes out sorted for the scorer.
+    for faces in combinations_with_replacement(range(12, -1, -1), 5):
+        if faces[0] == faces[4]:
+            continue  # Five of a kind does not exist.
+        p0, p1, p2, p3, p4 = (FACE_PRIMES[face] for face in faces)
+        lookup[p0 * p1 * p2 * p3 * p4] = _evaluate_nonflush(
+            *(face + 2 for face in faces)
+        )
+
+    # A multiset one face larger scores as its best sub-multiset, so spread every
+    # score over the keys it extends into and keep the maximum per key.
+    five_of_a_kind = [prime**5 for prime in FACE_PRIMES]
+    smaller = lookup
+    for __ in range(2):
+        larger: Dict[int, Score] = {}
+        get = larger.get
+        for key, score in smaller.items():
+            for prime, limit in zip(FACE_PRIMES, five_of_a_kind):
+                extended = key * prime
+                if extended % limit == 0:
+                    continue  # Five of a kind does not exist.
+                if get(extended, -1) < score:
+                    larger[extended] = score
+        lookup.update(larger)
+        smaller = larger
+    return lookup
+
+
+_FLUSH_LOOKUP: List[Score] = _build_flush_lookup()
+_NONFLUSH_LOOKUP: Dict[int, Score] = _build_nonflush_lookup()
+# Per sum of Card.suit_key, the shift of the suit holding five or more cards in
+# the card mask, -1 without a flush.
+_FLUSH_SHIFT: Tuple[int, ...] = tuple(
+    next((13 * suit for suit in range(4) if (key >> 3 * suit) & 7 >= 5), -1)
+    for key in range(1 << 12)
+)
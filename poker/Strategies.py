@@ -7,6 +7,10 @@ from poker.Cards import Cards
 from poker.Card import Card
 from poker.PokerHand import PokerHand
 
+from typing import Dict, List, Tuple
+from math import cos, log, sin, sqrt, tau
+
+import copy
 import random
 
 """
@@ -27,7 +31,7 @@ The `Action` class supports the following action types:
 
 - Action.Type.FOLD
     The player forfeits the round.
-    Use: Action(Action.Type.FOLD, 0)
+    Use: Action(Action.Type.FOLD, 0), or the shared Action.FOLD_0
 
 - Action.Type.RAISE
     The player increases the current bet.
@@ -42,7 +46,7 @@ The `Action` class supports the following action types:
     The player passes the action without betting.
     Equivalent to Action(Action.Type.CALL, 0) 
     Equivalent to Action(Action.Type.RAISE, 0)
-    Use: Action(Action.Type.CHECK, 0)
+    Use: Action(Action.Type.CHECK, 0), or the shared Action.CHECK_0
 
 - Action.Type.ALL_IN
     The player bets all their remaining money.
@@ -86,6 +90,12 @@ To implement a new strategy:
        def make_action(self, tablestate: TableState, me: Player) -> Action
 3. Return a valid `Action` based on the state of the table and your player's cards.
 4. Watch for Warnings from the table
+5. Treat the tablestate as read-only. The table hands one shared view to the
+   strategies between actions, a strategy that writes to the tablestate must set
+       modifies_tablestate = True
+   on its class to receive a private copy instead (see Cheater). A strategy that
+   hands the tablestate on to another strategy follows the flag of that one
+   (see CopyCat).
 Example:
 
     class AggressiveStrategy(Strategy):
@@ -101,18 +111,35 @@ You can then assign this strategy to a player:
 """
 
 
+def _standard_normal(normals: List[float]) -> float:
+    """Draws from N(0, 1), the Box-Muller transform refills normals 4096 at a time.
+
+    Each strategy keeps its own normals, so a fresh strategy after random.seed
+    draws the same values, whatever was drawn before in the process."""
+    if not normals:
+        rand = random.random
+        for __ in range(2048):
+            radius = sqrt(-2.0 * log(1.0 - rand()))
+            angle = tau * rand()
+            normals.append(radius * cos(angle))
+            normals.append(radius * sin(angle))
+    return normals.pop()
+
+
 # Example strategies.
 class AFolder(Strategy):
 
     def make_action(self, tablestate: TableState, me: Player) -> Action:
-        return Action(Action.Type.FOLD, 0)
+        return Action.FOLD_0
 
 
 class Cheater(Strategy):
 
+    modifies_tablestate = True
+
     def make_action(self, tablestate: TableState, me: Player) -> Action:
         tablestate.current_player().money = 100
-        return Action(Action.Type.FOLD, 0)
+        return Action.FOLD_0
 
 
 class ACaller(Strategy):
@@ -130,11 +157,12 @@ class King(Strategy):
 
         # If we can freely check -> CHECK!
         if required_chip_in == 0:
-            return Action(Action.Type.CHECK, 0)
+            return Action.CHECK_0
 
         # If we do not hold a picture card (A, K, Q, J) -> Fold.
-        if not Cards.contain_picture(me.cards):
-            return Action(Action.Type.FOLD, 0)
+        card1, card2 = me.cards
+        if not (Cards.IS_PICTURE[card1.code] or Cards.IS_PICTURE[card2.code]):
+            return Action.FOLD_0
 
         # If we do hold a picture card and we have funds!
         if me.money > required_chip_in + 2:
@@ -145,7 +173,7 @@ class King(Strategy):
             return Action(Action.Type.CALL, required_chip_in)
 
         # Fold.
-        return Action(Action.Type.FOLD, 0)
+        return Action.FOLD_0
 
 
 class ARaiser(Strategy):
@@ -174,12 +202,14 @@ class Random(Strategy):
                 # We call.
                 return Action(Action.Type.CALL, min_call_chip_in)
 
-            # Else we raise.
-            additional: Money = random.randint(min_call_chip_in, me.money)
+            # Else we raise, uniformly between min_call_chip_in and me.money.
+            additional: Money = min_call_chip_in + int(
+                random.random() * (me.money - min_call_chip_in + 1)
+            )
             return Action(Action.Type.RAISE, additional)
 
         # We fold.
-        return Action(Action.Type.FOLD, 0)
+        return Action.FOLD_0
 
 
 class CopyCat(AFolder):
@@ -189,6 +219,15 @@ class CopyCat(AFolder):
         self.play_for_steps: int = 10
         self.steps = 0
 
+    @property
+    def modifies_tablestate(self) -> bool:  # type: ignore[override]
+        # The tablestate is passed on to play_as, which may be replaced by the
+        # strategy of another player in the coming make_action.
+        return (
+            self.play_as.modifies_tablestate
+            or self.steps + 1 == self.play_for_steps
+        )
+
     def make_action(self, tablestate: TableState, me: Player) -> Action:
         self.steps += 1
 
@@ -197,9 +236,10 @@ class CopyCat(AFolder):
             self.steps = 0
             good_player = tablestate.get_big_stack_bully()
 
-            # Avoid playing as ourselves.
-            if not isinstance(good_player.strategy, CopyCat):
-                self.play_as = good_player.strategy
+            # Avoid playing as ourselves. The tablestate shares the strategies
+            # of the players, play as a copy to leave theirs untouched.
+            if type(good_player.strategy) is not CopyCat:
+                self.play_as = copy.deepcopy(good_player.strategy)
 
         return self.play_as.make_action(tablestate, me)
 
@@ -214,50 +254,83 @@ class Human(Strategy):
         if userInput.lower() == "y":
             bet = int(input("How much to chip-in?:"))
             return Action(Action.Type.CALL, bet)
-        return Action(Action.Type.FOLD, 0)
+        return Action.FOLD_0
 
 
 class Reinforcement(Strategy):
 
-    def __init__(self):
+    @staticmethod
+    def pocket_key(face1: Card.Face, face2: Card.Face, suited: bool = False) -> int:
+        """Index 0..168 of a pocket in the value_map.
+
+        The value_map is a 13x13 grid: pairs on the diagonal, suited pockets
+        above it and offsuit pockets below it."""
+        high = max(face1.value, face2.value) - 2
+        low = min(face1.value, face2.value) - 2
+        return high * 13 + low if suited else low * 13 + high
+
+    def __init__(self, batch_size: int = 1):
         super().__init__()
 
-        self.value_map = {
-            (face1, face2): [
-                50
-                + 5 * (face1.value > 10 or face2.value > 10)
-                + 5 * (face1.value == face2.value),
-                0,
-            ]
-            for face1 in Card.Face
-            for face2 in Card.Face
-        }
+        # Value and number of visits per pocket_key, as two parallel lists.
+        # A pocket starts at its preflop equity in percent, the grids are the same.
+        self.value_map: List[float] = list(Cards.PREFLOP_EQUITY)
+        self.visit_counts: List[int] = [0] * 169
 
         # print(self.value_map)
 
+        # Rewards are applied to the value_map once batch_size of them are pending.
+        self.batch_size = batch_size
+        self._pending: Dict[int, List[Money]] = {}  # pocket_key -> [count, total]
+        self._num_pending = 0
+
+        # The pocket dealt to us and its pocket_key.
+        self._pocket: Tuple[Card, ...] = ()
+        self._key: int = 0
+
+        # Standard normal draws not used yet, see _standard_normal.
+        self._normals: List[float] = []
+
+    def _pocket_key(self, me: Player) -> int:
+        """The pocket_key of our pocket, looked up once per dealt pocket."""
+        if me.cards is not self._pocket:
+            self._pocket = me.cards
+            self._key = Cards.POCKET_INDEX[me.cards[0].code * 52 + me.cards[1].code]
+        return self._key
+
     def win(self, tablestate, me, amount):
         # Learning step.
-        state = (me.cards[0].face, me.cards[1].face)
-        rstate = (me.cards[1].face, me.cards[0].face)
-        lr: float = 0.05
-        self.value_map[state][1] += 1
-        n: int = self.value_map[state][1]
-        self.value_map[state][0] += (amount - self.value_map[state][0]) / n
-        self.value_map[rstate] = self.value_map[state]
+        pending = self._pending.setdefault(self._pocket_key(me), [0, 0])
+        pending[0] += 1
+        pending[1] += amount
+        self._num_pending += 1
+        if self._num_pending >= self.batch_size:
+            self.update()
         return super().win(tablestate, me, amount)
 
+    def update(self) -> None:
+        """Applies the pending rewards to the value_map."""
+        values = self.value_map
+        visits = self.visit_counts
+        for key, (count, total) in self._pending.items():
+            visits[key] += count
+            # Running mean over visits, with the count new rewards in one step.
+            values[key] += (total - count * values[key]) / visits[key]
+        self._pending.clear()
+        self._num_pending = 0
+
     def make_action(self, tablestate: TableState, me: Player) -> Action:
         req_to_play: Money = tablestate.call_amount()
 
         # If we can freely check -> CHECK!
         if req_to_play == 0:
-            return Action(Action.Type.CHECK, 0)
+            return Action.CHECK_0
 
         # If it is not worth it.
-        value_to_play: float = self.value_map[(me.cards[0].face, me.cards[1].face)][0]
-        value_to_play += random.normalvariate()
+        value_to_play: float = self.value_map[self._pocket_key(me)]
+        value_to_play += _standard_normal(self._normals)
         if me.bet >= value_to_play:
-            return Action(Action.Type.FOLD, 0)
+            return Action.FOLD_0
 
         # If it is worth it and we have sufficient funds!
         additional_raise = int(random.random() * (me.money // 4) + req_to_play)
@@ -269,4 +342,4 @@ class Reinforcement(Strategy):
             return Action(Action.Type.CALL, req_to_play)
 
         # Fold.
-        return Action(Action.Type.FOLD, 0)
+        return Action.FOLD_0
@@ -7,6 +7,10 @@ from abc import ABC, abstractmethod
 
 class Strategy(ABC):
 
+    # Strategies that modify the tablestate handed to make_action get a private
+    # copy of it, the others share one view of the table between actions.
+    modifies_tablestate: bool = False
+
     @abstractmethod
     def make_action(self, tablestate: "TableState", me: "Player") -> Action:  # type: ignore
         """Subclasses must implement this method"""
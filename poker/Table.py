@@ -6,11 +6,15 @@ from poker.PokerHand import PokerHand
 from poker.Action import Action
 from poker.Card import Card
 
+from concurrent.futures import ProcessPoolExecutor
 from enum import Enum
-from copy import deepcopy
-from typing import Tuple
+from itertools import repeat
+from operator import attrgetter
+from typing import Callable, Dict, List, Optional, Tuple
 
 import logging
+import pickle
+import random
 
 
 class Table:
@@ -36,28 +40,87 @@ class Table:
         """
         return cls(init_state=TableState.new_game(players))
 
-    def __init__(self, init_state: TableState, loglevel=logging.WARNING):
+    # The table of this process, reused by simulate for every game.
+    _worker_table: Optional["Table"] = None
+
+    def __init__(
+        self,
+        init_state: TableState,
+        loglevel: int = logging.WARNING,
+        log_file: bool = True,
+    ) -> None:
         """
         Construct a simulator that simulates a poker table from an initial state onwards.
+
+        Without log_file the table logs to the terminal only, as in the workers.
         """
         assert len(init_state.players) >= 1, "Requires atleast one players!"
         assert len(init_state.players) <= 22, "Limited up to 22 players!"
-        self._create_logger(terminal_level=loglevel)
-        self._init_state: TableState = deepcopy(init_state)
-        self.state = deepcopy(self._init_state)
-        self._queried: dict[int, bool] = {}
-        self._deck = Deck(shuffle=True)
+        self._create_logger(terminal_level=loglevel, log_file=log_file)
+        # Two independent deep copies, pickling is faster than copy.deepcopy.
+        # The blob is kept, run_many hands it to the workers as it is.
+        self._init_blob = pickle.dumps(init_state, protocol=pickle.HIGHEST_PROTOCOL)
+        self._init_state: TableState = pickle.loads(self._init_blob)
+        self.state: TableState = pickle.loads(self._init_blob)
+        self._deck: Deck = Deck(shuffle=True)  # Reset in place for every hand.
         self.round_counter = 0
+        # The seats do not change, neither does the number of players.
+        self._n = len(init_state.players)
+        # One bit per player index, kept in sync with the player fields.
+        self._all_mask = (1 << self._n) - 1
+        self._folded_mask = 0
+        self._allin_mask = 0
+        self._broke_mask = 0  # money == 0
+        self._active_mask = 0  # Neither folded nor broke, __search_next_player
+        self._queried_mask = 0  # Responded this betting round, or cannot respond.
+        # Per index the next active player, built for the active mask _ring_mask.
+        self._next_active: List[int] = [0] * self._n
+        self._ring_mask = 0
+        # Per bet, the mask of active players that put in that bet this round.
+        self._bet_masks: Dict[Money, int] = {}
+        self._bets: List[Money] = [0] * self._n  # Player.bet per index, as filed.
+        # Running TableState.pot and TableState.max_bet, kept by _update_masks.
+        self._pot: Money = 0
+        self._max_bet: Money = 0
+        # Card masks, bit Card.code set per card, of the table and of each pocket.
+        self._community_mask = 0
+        self._hole_masks: List[int] = [0] * self._n
+        # Products of the Card.prime and sums of the Card.suit_key of the same
+        # cards, keys of the evaluator.
+        self._community_product = 1
+        self._hole_products: List[int] = [1] * self._n
+        self._community_suits = 0
+        self._hole_suits: List[int] = [0] * self._n
+        # Shared view of the table handed to strategies, rebuilt once the state
+        # moved past the _state_version it was taken at.
+        self._public_view: Optional[TableState] = None
+        self._view_version = -1
+        self._state_version = 0
+        # The handler of every event that can be scheduled.
+        self._handlers: Dict[
+            Table.Event, Callable[[TableState, int, Player], None]
+        ] = {
+            Table.Event.RESET: self._on_reset,
+            Table.Event.NEW_ROUND: self._on_new_round,
+            Table.Event.DEAL_PLAYER_CARD: self._on_deal_player_card,
+            Table.Event.START_BETTING_ROUND: self._on_start_betting_round,
+            Table.Event.QUERY_PLAYER: self._on_query_player,
+            Table.Event.DETERMINE_WINNER: self._on_determine_winner,
+            Table.Event.INCREMENT_BUTTONS: self._on_increment_buttons,
+            Table.Event.INCREASE_ROUND: self._on_increase_round,
+            Table.Event.SHOWDOWN: self._on_showdown,
+        }
         self.reset()
 
-    def _create_logger(self, terminal_level) -> None:
-        # create logger for "Sample App"
-        self._logger = logging.getLogger(__name__)
-        self._logger.setLevel(logging.DEBUG)
-
-        # create file handler which logs even debug messages
-        fh = logging.FileHandler("Table.log", mode="w", encoding="utf-8")
-        # fh.setLevel(logging.DEBUG)
+    def _create_logger(self, terminal_level: int, log_file: bool = True) -> None:
+        # create logger for "Sample App", tables without a log file get their own
+        # one that does not pass records on to the handlers of the other.
+        name = __name__ if log_file else f"{__name__}.worker"
+        self._logger = logging.getLogger(name)
+        if self._logger.handlers:
+            # The tables of a process share the handlers, attached only once.
+            self._logger.handlers[0].setLevel(terminal_level)
+            return
 
         # create console handler with a higher log level
         import sys
@@ -71,21 +134,104 @@ class Table:
             # + "(%(filename)s:%(lineno)s)",
             datefmt="%Y-%m-%d %H:%M:%S",
         )
-        fh.setFormatter(formatter)
         ch.setFormatter(formatter)
-
-        # add the handlers to the logger
         self._logger.addHandler(ch)
+        if not log_file:
+            self._logger.propagate = False
+            self._logger.setLevel(terminal_level)
+            return
+
+        # create file handler which logs even debug messages
+        fh = logging.FileHandler("Table.log", mode="w", encoding="utf-8")
+        fh.setFormatter(formatter)
+        self._logger.setLevel(logging.DEBUG)
         self._logger.addHandler(fh)
 
     def getWinner(self) -> Player:
         assert self.done(), "Table game not over yet!"
-        winner: Player = max(self.state.players, key=lambda player: player.money)
-        return self.state.players[self.state.players.index(winner)]
+        # max returns the first player with the most money, no index lookup needed.
+        return max(self.state.players, key=attrgetter("money"))
 
     def reset(self) -> None:
+        """Resets the table to the init_state, the players get fresh strategies."""
         self._execute(Table.Event.RESET)
 
+    def run(self) -> None:
+        """Steps the table until the game is done."""
+        while not self.done():
+            self.step()
+
+    def run_many(
+        self,
+        n_games: int,
+        seed: Optional[int] = None,
+        max_workers: Optional[int] = None,
+    ) -> List[Tuple[Money, ...]]:
+        """
+        Simulates n_games independent games from the init_state in worker processes.
+
+        Every game gets its own seed drawn from seed, so the results are
+        reproducible regardless of the number of workers.
+
+        Returns:
+            The final money per player index, one tuple per game.
+        """
+        rng = random.Random(seed)
+        seeds = [rng.getrandbits(32) for __ in range(n_games)]
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return list(
+                executor.map(
+                    Table._run_once,
+                    repeat(self._init_blob, n_games),
+                    seeds,
+                    chunksize=max(1, n_games // 64),
+                )
+            )
+
+    @staticmethod
+    def _run_once(init_blob: bytes, seed: int) -> Tuple[Money, ...]:
+        """Simulates one game in a worker process from the pickled init_state."""
+        table = Table.simulate(init_blob, seed)
+        return tuple(play.money for play in table.state.players)
+
+    @classmethod
+    def simulate(
+        cls,
+        init_blob: bytes,
+        seed: int,
+        on_round: Optional[Callable[["Table"], None]] = None,
+    ) -> "Table":
+        """
+        Simulates one game from the pickled init_state, seeded with seed.
+
+        The process keeps one table, logging to the terminal only, as long as the
+        init_state is the same. It is reset for every game, which gives the
+        players fresh strategies.
+
+        Args:
+            init_blob: The pickled init_state, as pickle.dumps(init_state).
+            seed: The seed of random for the game.
+            on_round: Called with the table after every round played.
+
+        Returns:
+            The table when the game is done, reused by the next simulate call.
+        """
+        table: Optional[Table] = cls._worker_table
+        if table is None or table._init_blob != init_blob:
+            table = cls._worker_table = cls(pickle.loads(init_blob), log_file=False)
+        random.seed(seed)
+        table.reset()
+
+        if on_round is None:
+            table.run()
+            return table
+        while not table.done():
+            table.step()
+            while table.round_underway() and not table.done():
+                table.step()
+            on_round(table)
+        return table
+
     def _schedule(self, event: Event) -> None:
         self._q = event
 
@@ -104,229 +250,306 @@ class Table:
         play_idx: int = state.player_at_hand_index
         play: Player = state.players[play_idx]
 
-        self._logger.debug(f"Executing {event.name}")
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug("Executing %s", event.name)
+        # Only the player actions of QUERY_PLAYER keep the public view valid.
+        if event != Table.Event.QUERY_PLAYER:
+            self._state_version += 1
 
         assert not play.folded
         assert not play.all_in
         assert play.money > 0
 
-        if event == Table.Event.RESET:
-
-            self._logger.info("Resetting Table to init_state.")
-            self.state = deepcopy(self._init_state)
-            self._queried: dict[int, bool] = {}
-            self._deck = Deck(shuffle=True)
-            self.round_counter = 0
-            self._schedule(Table.Event.NEW_ROUND)
-        elif event == Table.Event.NEW_ROUND:
-            # If we setup a table with only one player having money, we have a winner.
-            remain: Tuple[Player, ...] = tuple(
-                play for play in state.players if play.money > 0
-            )
-            if len(remain) == 1:
-                self._logger.info(f"We have a table winner! Player: {play_idx}")
-                self._q = Table.Event.DONE
-                return
-
-            self.round_counter += 1
-
-            # Otherwise shuffle the deck etc.
-            self._deck: Deck = Deck(shuffle=True)
-            self.state.round = TableState.Round.PREFLOP
-            self.state.cards = ()
-
+        handler = self._handlers.get(event)
+        assert handler is not None, f"Unknown event: {event}"
+        handler(state, play_idx, play)
+
+    def _on_reset(self, state: TableState, play_idx: int, play: Player) -> None:
+        self._logger.info("Resetting Table to init_state.")
+        self.state.restore(self._init_state)
+        # Fresh strategies as well, learned state does not carry over a reset.
+        fresh: TableState = pickle.loads(self._init_blob)
+        for play, fresh_play in zip(self.state.players, fresh.players):
+            play.strategy = fresh_play.strategy
+        self._sync_masks()
+        self._queried_mask = 0
+        self._deck.reset(shuffle=True)
+        self.round_counter = 0
+        self._state_version += 1
+        self._schedule(Table.Event.NEW_ROUND)
+
+    def _on_new_round(self, state: TableState, play_idx: int, play: Player) -> None:
+        # If we setup a table with only one player having money, we have a winner.
+        if (self._all_mask & ~self._broke_mask).bit_count() == 1:
+            if self._logger.isEnabledFor(logging.INFO):
+                self._logger.info("We have a table winner! Player: %d", play_idx)
+            self._q = Table.Event.DONE
+            return
+
+        self.round_counter += 1
+
+        # Otherwise collect and shuffle the deck etc.
+        self._deck.reset(shuffle=True)
+        self.state.round = TableState.Round.PREFLOP
+        self.state.cards = ()
+        self._community_mask = 0
+        self._community_product = 1
+        self._community_suits = 0
+
+        self._schedule(Table.Event.DEAL_PLAYER_CARD)
+
+    def _on_deal_player_card(
+        self, state: TableState, play_idx: int, play: Player
+    ) -> None:
+        # If current player has no cards.
+        if len(play.cards) == 0:
+            # If current player is the small_blind.
+            if play_idx == state.small_blind_index:
+                small_bet: Money = min(state.small_blind_amount, play.money)
+                self._logger.info(
+                    "Small blind Player %d chips in %d", play_idx, small_bet
+                )
+                play.all_in = small_bet == play.money
+                play.money -= small_bet
+                play.bet += small_bet
+
+            # If current player is the small_blind.
+            if play_idx == state.big_blind_index:
+                big_bet: Money = min(state.big_blind_amount, play.money)
+                self._logger.info("Big blind Player %d chips in %d", play_idx, big_bet)
+                play.all_in = big_bet == play.money
+                play.money -= big_bet
+                play.bet += big_bet
+            self._update_masks(play_idx)
+
+            card1, card2 = self._deck.deal(2)
+            self.state.players[play_idx].cards = (card1, card2)
+            self._hole_masks[play_idx] = 1 << card1.code | 1 << card2.code
+            self._hole_products[play_idx] = card1.prime * card2.prime
+            self._hole_suits[play_idx] = card1.suit_key + card2.suit_key
+            self.state.player_at_hand_index = self.__search_next_player(play_idx)
             self._schedule(Table.Event.DEAL_PLAYER_CARD)
-        elif event == Table.Event.DEAL_PLAYER_CARD:
-            # If current player has no cards.
-            if len(play.cards) == 0:
-                # If current player is the small_blind.
-                if play_idx == state.small_blind_index:
-                    small_bet: Money = min(state.small_blind_amount, play.money)
-                    self._logger.info(
-                        f"Small blind Player {play_idx} chips in {small_bet}"
-                    )
-                    play.all_in = small_bet == play.money
-                    play.money -= small_bet
-                    play.bet += small_bet
-
-                # If current player is the small_blind.
-                if play_idx == state.big_blind_index:
-                    big_bet: Money = min(state.big_blind_amount, play.money)
-                    self._logger.info(f"Big blind Player {play_idx} chips in {big_bet}")
-                    play.all_in = big_bet == play.money
-                    play.money -= big_bet
-                    play.bet += big_bet
-
-                card1 = self._deck.sample()
-                card2 = self._deck.sample()
-                self.state.players[play_idx].cards = (card1, card2)
-                self.state.player_at_hand_index = self.__search_next_player(play_idx)
-                self._schedule(Table.Event.DEAL_PLAYER_CARD)
-            else:
-                self._schedule(Table.Event.START_BETTING_ROUND)
-        elif event == Table.Event.START_BETTING_ROUND:
-            UTG = self.__search_next_player(state.big_blind_index)
-            self.state.player_at_hand_index = UTG
+        else:
+            self._schedule(Table.Event.START_BETTING_ROUND)
+
+    def _on_start_betting_round(
+        self, state: TableState, play_idx: int, play: Player
+    ) -> None:
+        UTG = self.__search_next_player(state.big_blind_index)
+        self.state.player_at_hand_index = UTG
+        if self._logger.isEnabledFor(logging.INFO):
             self._logger.info(
-                f"Starting Betting Round {state.round.name} with Player {UTG}"
+                "Starting Betting Round %s with Player %d", state.round.name, UTG
             )
 
-            self._queried = {
-                idx: p.folded or p.money == 0 for idx, p in enumerate(state.players)
-            }
-            self._schedule(Table.Event.QUERY_PLAYER)
-        elif event == Table.Event.QUERY_PLAYER:
+        # Only the active players still have to respond.
+        self._queried_mask = self._all_mask ^ self._active_mask
+        self._schedule(Table.Event.QUERY_PLAYER)
 
-            assert len(play.cards) == 2
+    def _on_query_player(self, state: TableState, play_idx: int, play: Player) -> None:
+        assert len(play.cards) == 2
 
-            # We arrive at a player that needs to make a move.
-            sitting_players = self.state.num_nonfolded_players()
-            betting_players = self.state.num_bettable_players()
+        # We arrive at a player that needs to make a move.
+        sitting_players = self._num_sitting_players()
+        betting_players = self._active_mask.bit_count()
 
-            # If we are the only non-folded player remaining.
-            if sitting_players == 1:
-                self._schedule(Table.Event.DETERMINE_WINNER)
-                return
+        # If we are the only non-folded player remaining.
+        if sitting_players == 1:
+            self._schedule(Table.Event.DETERMINE_WINNER)
+            return
 
-            # If we can only play against ourselves...
-            if betting_players == 1:
-                self._schedule(Table.Event.SHOWDOWN)
-                return
+        # If we can only play against ourselves...
+        if betting_players == 1:
+            self._schedule(Table.Event.SHOWDOWN)
+            return
 
-            # Get and implement the current player action.
-            self._get_and_implement_player_action()
-            self._queried[play_idx] = True
-            # Go to the next player.
-            self.state.player_at_hand_index = self.__search_next_player(play_idx)
-
-            # Betting is done if betting_equal and everybody responded.
-            betting_equal = all(
-                other.folded
-                or other == play
-                or (other.all_in and play.bet >= other.bet)
-                or (not other.all_in and (other.money == 0 or other.bet == play.bet))
-                for other in self.state.players
-            )
+        # Get and implement the current player action.
+        self._get_and_implement_player_action()
+        self._queried_mask |= 1 << play_idx
+        # Go to the next player.
+        state.player_at_hand_index = self.__search_next_player(play_idx)
 
-            # If current player folded remaining.
-            if self.state.num_nonfolded_players() == 1:
-                self._execute(Table.Event.DETERMINE_WINNER)
-                return
+        # If current player folded remaining.
+        if self._num_sitting_players() == 1:
+            self._execute(Table.Event.DETERMINE_WINNER)
+            return
+
+        # Betting is done if betting_equal and everybody responded: all other
+        # active players match our bet and no other all-in player bet more.
+        bit = 1 << play_idx
+        bet = play.bet
+        unmatched = self._active_mask & ~bit & ~self._bet_masks.get(bet, 0)
+        betting_equal = not unmatched
+        all_in = self._allin_mask & ~self._folded_mask & ~bit
+        bets = self._bets
+        while all_in and betting_equal:
+            low = all_in & -all_in
+            betting_equal = bet >= bets[low.bit_length() - 1]
+            all_in ^= low
+
+        # If this betting round is completed.
+        if betting_equal and self._queried_mask == self._all_mask:
+            self._execute(Table.Event.INCREASE_ROUND)
+        else:
+            # Else we QUERY the other players
+            self._schedule(Table.Event.QUERY_PLAYER)
 
-            # If this betting round is completed.
-            if betting_equal and all(self._queried.values()):
-                self._execute(Table.Event.INCREASE_ROUND)
-            else:
-                # Else we QUERY the other players
-                self._schedule(Table.Event.QUERY_PLAYER)
-        elif event == Table.Event.DETERMINE_WINNER:
-            # Loop over all non-folded players that remain in the game with positive bet
-            remaining_players = [
-                (
-                    idx,
-                    play,
-                    (
-                        PokerHand.best(self.state.cards + play.cards)
-                        if len(self.state.cards + play.cards) == 7
-                        else 0
-                    ),
+    def _on_determine_winner(
+        self, state: TableState, play_idx: int, play: Player
+    ) -> None:
+        # Loop over all non-folded players that remain in the game with positive bet
+        folded = self._folded_mask
+        remaining = [
+            (idx, state.players[idx])
+            for idx, bet in enumerate(self._bets)
+            if bet > 0 and not folded >> idx & 1
+        ]
+
+        # If there is only one player remaining.
+        if len(remaining) == 1:
+            # Give the entire pot to the player.
+            win_idx: int = remaining[0][0]
+
+            if self._logger.isEnabledFor(logging.INFO):
+                self._logger.info("Player %d wins %d!", win_idx, self._pot)
+            self.state.players[win_idx].money += self._pot
+            self._execute(Table.Event.INCREMENT_BUTTONS)
+            return
+
+        # Score the hands only once they are compared.
+        community = self._community_mask
+        community_product = self._community_product
+        hole_masks = self._hole_masks
+        hole_products = self._hole_products
+        community_suits = self._community_suits
+        hole_suits = self._hole_suits
+        board = state.cards
+        if len(board) == 5:
+            scores = [
+                PokerHand.best7(
+                    community | hole_masks[idx],
+                    community_product * hole_products[idx],
+                    community_suits + hole_suits[idx],
                 )
-                for idx, play in enumerate(self.state.players)
-                if play.bet > 0 and not play.folded
+                for idx, __ in remaining
             ]
-
-            # If there is only one player remaining.
-            if len(remaining_players) == 1:
-                # Give the entire pot to the player.
-                win_idx: int = remaining_players[0][0]
-
-                self._logger.info(f"Player {win_idx} wins {self.state.pot()}!")
-                self.state.players[win_idx].money += self.state.pot()
-                self._execute(Table.Event.INCREMENT_BUTTONS)
-                return
-            # Sort on score.
-            remaining_players.sort(key=lambda x: x[2])
-            max_score = max(x[2] for x in remaining_players)
-
-            # Step 2: Filter out tuples where second value >= min_second
-            winner_idx = [x[0] for x in remaining_players if x[2] == max_score]
-
-            # Take Profit.
-            self._logger.info(f"Community cards: {self.state.cards}")
-            pot: Money = self.state.pot()
-            for idx, player, hand in remaining_players:
-                if idx in winner_idx:
+        else:
+            scores = [0] * len(remaining)
+
+        # Step 2: The winners are the players with the max_score.
+        max_score = max(scores)
+        num_winners = scores.count(max_score)
+
+        # Take Profit.
+        log_hands = self._logger.isEnabledFor(logging.INFO)
+        if log_hands:
+            self._logger.info("Community cards: %s", board)
+        share: Money = self._pot // num_winners
+        for (idx, player), score in zip(remaining, scores):
+            if score == max_score:
+                if log_hands:
+                    # Only the log shows the hand, scoring went through the masks.
+                    hand = score and PokerHand.best(board + player.cards, score)
                     self._logger.info(
-                        f"Player {idx} cards: {player.cards}, Best {hand}"
+                        "Player %d cards: %s, Best %s", idx, player.cards, hand
                     )
-                    self._logger.info(f"Player {idx} wins €{pot // len(winner_idx)}")
-                    player.money += pot // len(winner_idx)
-                    player.strategy.win(state, player, pot // len(winner_idx))
-                else:
-                    player.strategy.win(state, player, 0)
-
-            self._execute(Table.Event.INCREMENT_BUTTONS)
-        elif event == Table.Event.INCREMENT_BUTTONS:
-            # Reset everything.
-            for play in self.state.players:
-                play.bet = 0
-                play.folded = False
-                play.all_in = False
-                play.cards = ()
-            # Increment the buttons.
-            self.state.small_blind_index = self.__search_next_player(
-                self.state.small_blind_index
-            )
-            self.state.big_blind_index = self.__search_next_player(
-                self.state.small_blind_index
-            )
-            self.state.player_at_hand_index = self.__search_next_player(
-                self.state.big_blind_index
-            )
-
-            self._schedule(Table.Event.NEW_ROUND)
-        elif event == Table.Event.INCREASE_ROUND:
-            if self.state.round == TableState.Round.PREFLOP:
-                self._deal_card_to_table(3, 1)
-                self.state.round = TableState.Round.FLOP
-            elif self.state.round == TableState.Round.FLOP:
-                self._deal_card_to_table(1, 1)
-                self.state.round = TableState.Round.RIVER
-            elif self.state.round == TableState.Round.RIVER:
-                self._deal_card_to_table(1, 1)
-                self.state.round = TableState.Round.TURN
-            elif self.state.round == TableState.Round.TURN:
-                self._schedule(Table.Event.SHOWDOWN)
-                return
-            self._schedule(Table.Event.START_BETTING_ROUND)
-        elif event == Table.Event.SHOWDOWN:
-            # If not all cards are on the table. Put them.
-            while self.state.round != TableState.Round.TURN:
-                self._execute(Table.Event.INCREASE_ROUND)
+                    self._logger.info("Player %d wins €%d", idx, share)
+                player.money += share
+                player.strategy.win(state, player, share)
+            else:
+                player.strategy.win(state, player, 0)
+
+        self._execute(Table.Event.INCREMENT_BUTTONS)
+
+    def _on_increment_buttons(
+        self, state: TableState, play_idx: int, play: Player
+    ) -> None:
+        # Reset everything.
+        for play in self.state.players:
+            play.bet = 0
+            play.folded = False
+            play.all_in = False
+            play.cards = ()
+        self._sync_masks()
+        # Increment the buttons.
+        self.state.small_blind_index = self.__search_next_player(
+            self.state.small_blind_index
+        )
+        self.state.big_blind_index = self.__search_next_player(
+            self.state.small_blind_index
+        )
+        self.state.player_at_hand_index = self.__search_next_player(
+            self.state.big_blind_index
+        )
 
-            # Determine the winner.
-            self._execute(Table.Event.DETERMINE_WINNER)
-        else:
-            assert False, f"Unknown event: {event}"
+        self._schedule(Table.Event.NEW_ROUND)
+
+    def _on_increase_round(
+        self, state: TableState, play_idx: int, play: Player
+    ) -> None:
+        if self.state.round == TableState.Round.PREFLOP:
+            self._deal_card_to_table(3, 1)
+            self.state.round = TableState.Round.FLOP
+        elif self.state.round == TableState.Round.FLOP:
+            self._deal_card_to_table(1, 1)
+            self.state.round = TableState.Round.RIVER
+        elif self.state.round == TableState.Round.RIVER:
+            self._deal_card_to_table(1, 1)
+            self.state.round = TableState.Round.TURN
+        elif self.state.round == TableState.Round.TURN:
+            self._schedule(Table.Event.SHOWDOWN)
+            return
+        self._schedule(Table.Event.START_BETTING_ROUND)
+
+    def _on_showdown(self, state: TableState, play_idx: int, play: Player) -> None:
+        # If not all cards are on the table. Put them, with a single burn card.
+        needed = 5 - len(self.state.cards)
+        if needed:
+            self._deal_card_to_table(needed, num_burn_cards=1)
+            self.state.round = TableState.Round.TURN
+
+        # Determine the winner.
+        self._execute(Table.Event.DETERMINE_WINNER)
 
     def _deal_card_to_table(self, num_cards: int, num_burn_cards: int = 1) -> None:
-        for __ in range(num_burn_cards):
-            self._deck.sample()
-        for __ in range(num_cards):
-            card: Card = self._deck.sample()
-            self.state.cards = self.state.cards + (card,)
+        # Burn cards are dealt along with the table cards and discarded.
+        cards: List[Card] = self._deck.deal(num_burn_cards + num_cards)
+        self.state.cards = self.state.cards + tuple(cards[num_burn_cards:])
+        for card in cards[num_burn_cards:]:
+            self._community_mask |= 1 << card.code
+            self._community_product *= card.prime
+            self._community_suits += card.suit_key
+        self._state_version += 1
 
     def _get_player_action(self) -> Action:
+        play_idx: int = self.state.player_at_hand_index
+        play: Player = self.state.players[play_idx]
         # Obtain the raw action from the strategy run by the player.
-        return self.state.current_player().strategy.make_action(  # type: ignore
-            TableState.obscure_for_player(self.state, self.state.player_at_hand_index),
-            self.state.current_player(),
-        )
+        return play.strategy.make_action(self._view_for_player(play_idx), play)
+
+    def _view_for_player(self, play_idx: int) -> TableState:
+        """The table as observed by a player, the cards of others are hidden."""
+        state: TableState = self.state
+        if state.players[play_idx].strategy.modifies_tablestate:
+            return TableState.obscure_for_player(state, play_idx)
+
+        view: Optional[TableState] = self._public_view
+        if view is None or self._view_version != self._state_version:
+            view = self._public_view = TableState.public_view(state)
+            view._max_bet = self._max_bet
+            view._pot = self._pot
+            self._view_version = self._state_version
+        else:
+            # Hide the cards of the player the view was handed to before.
+            view.players[view.player_at_hand_index].cards = ()
+        view.player_at_hand_index = play_idx
+        view.players[play_idx].cards = state.players[play_idx].cards
+        return view
 
     def _get_and_implement_player_action(self, quiet: bool = False) -> None:
         self._implement_player_action(self._get_player_action(), quiet)
 
-    def _implement_player_action(self, action: Action, quiet: bool = False):
+    def _implement_player_action(self, action: Action, quiet: bool = False) -> None:
         # Current player index.
         play_idx: int = self.state.player_at_hand_index
 
@@ -334,37 +557,51 @@ class Table:
         action = self._validateAction(action)
 
         # Implement the action.
-        self.state.players[play_idx].bet += action.amount
-        self.state.players[play_idx].money -= action.amount
-        if action.type == Action.Type.FOLD:
-            self.state.players[play_idx].folded = True
-        elif action.type == Action.Type.ALL_IN:
-            self.state.players[play_idx].all_in = True
-
-        self._logger.info(f"Player {play_idx} {action}")
+        play: Player = self.state.players[play_idx]
+        action_type: Action.Type = action.type
+        play.bet += action.amount
+        play.money -= action.amount
+        if action_type is Action.Type.FOLD:
+            play.folded = True
+        elif action_type is Action.Type.ALL_IN:
+            play.all_in = True
+        self._update_masks(play_idx)
+        # Only an action without chips leaves the table as it was, a CHECK is
+        # validated with any amount.
+        if action.amount != 0 or action_type is Action.Type.FOLD:
+            self._state_version += 1
+
+        if self._logger.isEnabledFor(logging.INFO):
+            self._logger.info("Player %d %s", play_idx, action)
 
     def _validateAction(self, action: Action) -> Action:
         play_idx: int = self.state.player_at_hand_index
-        play_money: Money = self.state.players[play_idx].money
+        play: Player = self.state.players[play_idx]
+        play_money: Money = play.money
+        action_type: Action.Type = action.type
         amount: Money = action.amount
-        foldAction = Action(Action.Type.FOLD, 0)
+        foldAction = Action.FOLD_0
+
+        # A FOLD with 0 passes every check below, skip them.
+        if action_type is Action.Type.FOLD and amount == 0:
+            return action
 
         # Negative betting not allowed.
-        if action.amount < 0:
+        if amount < 0:
             self._logger.warning(
                 f"Player {play_idx} has negative action.amount: {amount}"
             )
             return foldAction
 
         # Fractional betting not allowed.
-        if int(action.amount) != action.amount:
+        if int(amount) != amount:
             self._logger.warning(
                 f"Player {play_idx} has fractional action.amount: {amount}"
             )
             return foldAction
 
         # Betting more than the player money not allowed.
-        if action.amount > play_money:
+        if amount > play_money:
             self._logger.warning(
                 f"Player {play_idx} chips in {amount} but owns {play_money}"
             )
@@ -372,12 +609,12 @@ class Table:
 
         # Warning if the player folds with action.amount > 0
         # The user probably intended Action(Action.Type.FOLD, 0)
-        if action.type == Action.Type.FOLD and amount > 0:
+        if action_type is Action.Type.FOLD:
             self._logger.warning(f"Player {play_idx} FOLDED with {amount} > 0.")
             return foldAction
 
         # If we go all in but have money remaining
-        if action.type == Action.Type.ALL_IN and amount < play_money:
+        if action_type is Action.Type.ALL_IN and amount < play_money:
             self._logger.warning(
                 f"Player {play_idx} ALL INed but has €{play_money - amount}"
             )
@@ -385,30 +622,97 @@ class Table:
 
         # If we bet the remaining money
         # Silently convert to ALL_IN
-        if action.amount == play_money:
+        if amount == play_money:
             return Action(Action.Type.ALL_IN, play_money)
 
-        if action.amount < self.state.call_amount() and action.type != Action.Type.FOLD:
+        call_amount: Money = self._max_bet - play.bet
+        if amount < call_amount:
             self._logger.warning(
-                f"Player {play_idx} {action.type.name} {action.amount} which is lower than the required amount {self.state.call_amount()}"
+                f"Player {play_idx} {action_type.name} {amount} which is lower than the required amount {call_amount}"
             )
             return foldAction
 
         # If we RAISE with 0.
         # Silently convert to CHECK.
-        if action.amount == 0 and action.type != Action.Type.FOLD:
-            return Action(Action.Type.CHECK, 0)
+        if amount == 0 and action_type is not Action.Type.CHECK:
+            return Action.CHECK_0
 
         return action
 
+    def _update_masks(self, play_idx: int) -> None:
+        """Copies the folded, all_in, money == 0 and bet of a player to the masks."""
+        play: Player = self.state.players[play_idx]
+        bit = 1 << play_idx
+        self._folded_mask = self._folded_mask & ~bit | bit * play.folded
+        self._allin_mask = self._allin_mask & ~bit | bit * play.all_in
+        self._broke_mask = self._broke_mask & ~bit | bit * (play.money == 0)
+        self._active_mask = self._all_mask & ~(self._folded_mask | self._broke_mask)
+
+        # File the player under its current bet, as long as it can still bet.
+        bet_masks = self._bet_masks
+        filed = self._bets[play_idx]
+        bet_masks[filed] = bet_masks.get(filed, 0) & ~bit
+        self._bets[play_idx] = play.bet
+        if self._active_mask & bit:
+            bet_masks[play.bet] = bet_masks.get(play.bet, 0) | bit
+
+        # Folded bets stay in the pot, but no longer count towards max_bet.
+        self._pot += play.bet - filed
+        if not play.folded:
+            if play.bet > self._max_bet:
+                self._max_bet = play.bet
+        elif filed == self._max_bet:
+            folded = self._folded_mask
+            self._max_bet = max(
+                (bet for idx, bet in enumerate(self._bets) if not folded >> idx & 1),
+                default=0,
+            )
+
+    def _sync_masks(self) -> None:
+        """Rebuilds the player masks from the players of the current state."""
+        self._folded_mask = self._allin_mask = self._broke_mask = 0
+        self._bet_masks.clear()
+        self._bets = [0] * self._n
+        self._pot = self._max_bet = 0
+        for idx in range(self._n):
+            self._update_masks(idx)
+
+    def _num_sitting_players(self) -> int:
+        """TableState.num_nonfolded_players, counted on the player masks."""
+        sitting = ~self._folded_mask & (~self._broke_mask | self._allin_mask)
+        return (sitting & self._all_mask).bit_count()
+
     # Search for the next active player.
     def __search_next_player(self, p_idx: int) -> int:
-        state: TableState = self.state
-        n: int = state.num_players()
-        p_idx += 1
-        p_idx %= n
-
-        while state.players[p_idx].folded or state.players[p_idx].money == 0:
-            p_idx += 1
-            p_idx %= n
-        return p_idx
+        if self._ring_mask != self._active_mask:
+            self._build_ring()
+        return self._next_active[p_idx]
+
+    def _build_ring(self) -> None:
+        """Per index, the next active player, for the current _active_mask."""
+        active = self._active_mask
+        assert active, "No active player left!"
+        next_active = self._next_active
+        n = self._n
+
+        # Players that left since the last build are spliced out of the ring:
+        # the indices pointing at them now point one active player further.
+        left = self._ring_mask & ~active
+        if self._ring_mask and left == self._ring_mask ^ active:
+            while left:
+                idx = (left & -left).bit_length() - 1
+                skip_to = next_active[idx]
+                prev = idx - 1 if idx else n - 1
+                while next_active[prev] == idx:
+                    next_active[prev] = skip_to
+                    prev = prev - 1 if prev else n - 1
+                left &= left - 1
+        else:
+            # The lowest active index above idx, else wrap to the lowest one.
+            lowest = (active & -active).bit_length() - 1
+            for idx in range(n):
+                above = active >> (idx + 1)
+                next_active[idx] = (
+                    idx + (above & -above).bit_length() if above else lowest
+                )
+        self._ring_mask = active
@@ -3,12 +3,12 @@ from poker.Player import Player
 from poker.Money import Money
 
 from enum import Enum
-from dataclasses import dataclass
-from typing import Tuple
-import copy
+from dataclasses import dataclass, field
+from operator import attrgetter
+from typing import Optional, Tuple
 
 
-@dataclass
+@dataclass(slots=True)
 class TableState:
 
     class Round(Enum):
@@ -26,6 +26,12 @@ class TableState:
     small_blind_amount: Money  # Amount of money put in by the small blind, initially.
     big_blind_index: int  # Index of the player that is small blind.
     big_blind_amount: Money
+    # Known max_bet and pot, the Table fills them in for the views it hands out
+    # from its running totals. Otherwise they are computed from the players.
+    _max_bet: Optional[Money] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _pot: Optional[Money] = field(default=None, init=False, repr=False, compare=False)
 
     # Returns the number of players.
     def num_players(self) -> int:
@@ -48,8 +54,9 @@ class TableState:
 
     # Returns the highest standing bet of active players.
     def max_bet(self) -> Money:
-        bets = (p.bet for p in self.players if p.bet > 0 and not p.folded)
-        return max(bets)
+        if self._max_bet is not None:
+            return self._max_bet
+        return max(p.bet for p in self.players if p.bet > 0 and not p.folded)
 
     # How much should the current player add to the pot for a call.
     def call_amount(self) -> Money:
@@ -57,6 +64,8 @@ class TableState:
 
     # Sums the money in the pot
     def pot(self) -> Money:
+        if self._pot is not None:
+            return self._pot
         return sum(player.bet for player in self.players)
 
     # Sums the players money.
@@ -65,12 +74,11 @@ class TableState:
 
     def get_big_stack_bully(self) -> Player:
         """Get the player with the most chips"""
-        bigstack:Player = max(self.players, key= lambda player: player.money)
-        return self.players[self.players.index(bigstack)]
+        return max(self.players, key=attrgetter("money"))
 
     @classmethod
     def obscure_for_player(cls, other: "TableState", player_id: int) -> "TableState":
-        obscured_state: "TableState" = copy.deepcopy(other)
+        obscured_state: "TableState" = other.clone()
 
         # Set the cards of other players to empty.
         for idx, play in enumerate(obscured_state.players):
@@ -78,6 +86,47 @@ class TableState:
                 play.cards = ()
         return obscured_state
 
+    def restore(self, other: "TableState") -> None:
+        """Copies the fields of other into this state and its players, in place.
+
+        The players keep their strategy, so strategies carry over a restore."""
+        for play, other_play in zip(self.players, other.players):
+            play.money = other_play.money
+            play.cards = other_play.cards
+            play.folded = other_play.folded
+            play.all_in = other_play.all_in
+            play.bet = other_play.bet
+        self.round = other.round
+        self.cards = other.cards
+        self.player_at_hand_index = other.player_at_hand_index
+        self.small_blind_index = other.small_blind_index
+        self.small_blind_amount = other.small_blind_amount
+        self.big_blind_index = other.big_blind_index
+        self.big_blind_amount = other.big_blind_amount
+
+    def clone(self) -> "TableState":
+        """Copy of the table with cloned players, the strategies are shared."""
+        return TableState(
+            self.round,
+            self.cards,
+            tuple(play.clone() for play in self.players),
+            self.player_at_hand_index,
+            self.small_blind_index,
+            self.small_blind_amount,
+            self.big_blind_index,
+            self.big_blind_amount,
+        )
+
+    @classmethod
+    def public_view(cls, other: "TableState") -> "TableState":
+        """Copy of the table with the cards of every player hidden.
+
+        Players are copied shallowly, their strategies are shared with other."""
+        view: "TableState" = other.clone()
+        for play in view.players:
+            play.cards = ()
+        return view
+
     @classmethod
     def new_game(
         cls,
@@ -28,6 +28,15 @@ class TableWithWindow(Table):
 
         # Add windows.
         self.windowsettings = windowsettings
+        # The settings are read once per drawn card and player, keep them at hand.
+        self._cw = windowsettings.CARD_WIDTH
+        self._ch = windowsettings.CARD_HEIGHT
+        self._rr = windowsettings.PLAYER_RADIUS_RATIO
+        # Per number of players, the (cos, sin) of the angle of each seat.
+        self._trig_cache: dict[int, list[tuple[float, float]]] = {}
+        # Canvas items by key, kept across redraws and hidden while unused.
+        self._items: dict[str, int] = {}
+        self._drawn: set[str] = set()
 
         self._root = tk.Tk()
         self._root.title("Poker Table")
@@ -73,9 +82,11 @@ class TableWithWindow(Table):
 
     def __on_resize(self, event: tk.Event) -> None:
         if self._root:
-            self.canvas_width = event.width
-            self.canvas_height = event.height
-            self._canvas.delete("all")
+            # Drawn items stay in place, only a new canvas size needs a redraw.
+            size = (event.width, event.height)
+            if self._items and size == (self.canvas_width, self.canvas_height):
+                return
+            self.canvas_width, self.canvas_height = size
         if self.state:
             self.draw(self.state)
 
@@ -87,52 +98,81 @@ class TableWithWindow(Table):
         if not self._canvas:
             return
         self.state = state
-        self._canvas.delete("all")
+        self._drawn.clear()
 
         self._root.title(f"PokerTable: {state.round}")
-        PLAYER_RADIUS_RATIO = self.windowsettings.PLAYER_RADIUS_RATIO
-        CARD_WIDTH = self.windowsettings.CARD_WIDTH
-        CARD_HEIGHT = self.windowsettings.CARD_HEIGHT
+        cw = self._cw
+        ch = self._ch
+        draw_player = self._draw_player
+        draw_card = self._draw_card
 
         cx, cy = self.canvas_width // 2, self.canvas_height // 2
-        radius = int(min(self.canvas_width, self.canvas_height) * PLAYER_RADIUS_RATIO)
+        radius = int(min(self.canvas_width, self.canvas_height) * self._rr)
 
         n: int = state.num_players()
 
         # Draw players around the table
-        self._canvas.create_oval(
-            cx - radius, cy - radius, cx + radius, cy + radius, fill="green"
+        self._place(
+            "table",
+            self._canvas.create_oval,
+            (cx - radius, cy - radius, cx + radius, cy + radius),
+            fill="green",
         )
+        trig = self._trig_cache.get(n)
+        if trig is None:
+            angles = [2 * math.pi * i / n for i in range(n)]
+            trig = self._trig_cache[n] = [(math.cos(a), math.sin(a)) for a in angles]
         for i in range(n):
-            angle = 2 * math.pi * i / n
-            px = cx + radius * math.cos(angle)
-            py = cy + radius * math.sin(angle)
-            self._draw_player(i, px, py, state)
+            c, s = trig[i]
+            draw_player(i, cx + radius * c, cy + radius * s, state)
 
         # Draw community cards
-        spacing = CARD_WIDTH + 10
+        spacing = cw + 10
         start_x = cx - (len(state.cards) * spacing) // 2
+        y = cy - ch // 2
         for i, card in enumerate(state.cards):
             x = start_x + i * spacing
-            y = cy - CARD_HEIGHT // 2
-            self._draw_card(x, y, card, face_up=True)
+            draw_card(f"board{i}", x, y, card, face_up=True)
+
+        # Hide the items that are not part of this state, they are reused later.
+        itemconfigure = self._canvas.itemconfigure
+        for key, item in self._items.items():
+            if key not in self._drawn:
+                itemconfigure(item, state="hidden")
+
+    def _place(
+        self, key: str, create: Callable[..., int], coords: tuple, **options
+    ) -> None:
+        """Moves and updates the canvas item of key, it is created on first use."""
+        item = self._items.get(key)
+        if item is None:
+            self._items[key] = create(*coords, **options)
+        else:
+            self._canvas.coords(item, *coords)
+            self._canvas.itemconfigure(item, state="normal", **options)
+        self._drawn.add(key)
 
-    def _draw_card(self, x: float, y: float, card: Card, face_up: bool = True):
+    def _draw_card(
+        self, key: str, x: float, y: float, card: Card, face_up: bool = True
+    ):
         fill = {
             Card.Suit.c: "ORANGE",
             Card.Suit.d: "PINK",
             Card.Suit.h: "GREY",
             Card.Suit.s: "YELLOW",
         }[card.suit]
-        CARD_WIDTH = self.windowsettings.CARD_WIDTH
-        CARD_HEIGHT = self.windowsettings.CARD_HEIGHT
-        self._canvas.create_rectangle(x, y, x + CARD_WIDTH, y + CARD_HEIGHT, fill=fill)
-        self._canvas.create_text(
-            x + CARD_WIDTH / 2, y + CARD_HEIGHT / 2, text=str(card)
+        cw = self._cw
+        ch = self._ch
+        canvas = self._canvas
+        self._place(key, canvas.create_rectangle, (x, y, x + cw, y + ch), fill=fill)
+        self._place(
+            key + ".text", canvas.create_text, (x + cw / 2, y + ch / 2), text=str(card)
         )
 
     def _draw_player(self, index: int, x: float, y: float, state: "TableState"):
         player: Player = state.players[index]
+        create_text = self._canvas.create_text
+        key = f"player{index}"
 
         folded = player.folded
         at_hand = index == state.player_at_hand_index
@@ -142,32 +182,37 @@ class TableWithWindow(Table):
         color = "purple"
         if at_hand:
             color = "blue"
-            self._canvas.create_text(x, y + 50, text=f"${money}", fill="white")
-            self._canvas.create_text(x, y + 65, text=f"Bet: {bet}", fill="white")
         elif player.all_in:
             color = "gold"
-            self._canvas.create_text(x, y + 50, text=f"${money}", fill="white")
-            self._canvas.create_text(x, y + 65, text=f"Bet: {bet}", fill="white")
         elif player.money == 0:
             color = "green"
-        else:
-            self._canvas.create_text(x, y + 50, text=f"${money}", fill="white")
-            self._canvas.create_text(x, y + 65, text=f"Bet: {bet}", fill="white")
-
-        self._canvas.create_oval(x - 30, y - 30, x + 30, y + 30, fill=color)
-        self._canvas.create_text(x, y - 40, text=f"Player {index}", fill="white")
+        if color != "green":
+            self._place(
+                key + ".money", create_text, (x, y + 50), text=f"${money}", fill="white"
+            )
+            self._place(
+                key + ".bet", create_text, (x, y + 65), text=f"Bet: {bet}", fill="white"
+            )
+
+        self._place(
+            key, self._canvas.create_oval, (x - 30, y - 30, x + 30, y + 30), fill=color
+        )
+        name = f"Player {index}"
+        self._place(key + ".name", create_text, (x, y - 40), text=name, fill="white")
 
         # Draw buttons.
         if index == state.small_blind_index:
-            self._canvas.create_text(x, y, text="SMALL")
+            self._place(key + ".button", create_text, (x, y), text="SMALL")
         elif index == state.big_blind_index:
-            self._canvas.create_text(x, y, text="BIG")
+            self._place(key + ".button", create_text, (x, y), text="BIG")
 
         # Draw hole cards for non-folded players with cards.
         if len(player.cards) == 2 and not folded:
-            CARD_WIDTH = self.windowsettings.CARD_WIDTH
-            self._draw_card(x + CARD_WIDTH, y, player.cards[0], face_up=True)
-            self._draw_card(x + CARD_WIDTH * 2, y, player.cards[1], face_up=True)
+            cw = self._cw
+            self._draw_card(key + ".card0", x + cw, y, player.cards[0], face_up=True)
+            self._draw_card(
+                key + ".card1", x + cw * 2, y, player.cards[1], face_up=True
+            )
 
     def __start_play(self) -> None:
         if not self.running:
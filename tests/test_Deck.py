@@ -0,0 +1,38 @@
+from poker.Card import Card
+from poker.Deck import Deck
+
+import random
+import unittest
+
+
+class TestDeck(unittest.TestCase):
+
+    def test_unshuffled_deck_deals_in_fixed_order(self):
+        # An unshuffled deck has the highest card on top, whatever the seed.
+        dealt = []
+        for seed in range(3):
+            random.seed(seed)
+            deck = Deck(shuffle=False)
+            dealt.append((deck.draw(), deck.sample(), *deck.deal(3)))
+        self.assertEqual(dealt[0], dealt[1])
+        self.assertEqual(dealt[0], dealt[2])
+        self.assertEqual(dealt[0][0], Card(Card.Suit.d, Card.Face.ACE))
+        self.assertEqual(dealt[0][1], Card(Card.Suit.d, Card.Face.KING))
+
+    def test_unshuffled_deck_deals_in_fixed_order_after_reset(self):
+        deck = Deck(shuffle=False)
+        first = deck.deal(52)
+        deck.reset(shuffle=False)
+        self.assertEqual(deck.deal(52), first)
+        self.assertEqual(len(set(first)), 52)
+
+    def test_shuffled_deck_deals_every_card_once(self):
+        random.seed(0)
+        deck = Deck()
+        cards = deck.deal(50) + [deck.draw(), deck.sample()]
+        self.assertEqual(len(set(cards)), 52)
+        self.assertIsNone(deck.draw())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+from poker.Card import ALL_CARDS, Card
+from poker.PokerHand import PokerHand
+
+from collections import Counter
+from itertools import combinations
+
+import random
+import unittest
+
+
+def _reference_key(cards):
+    """The tier and tie-breaking faces of 5 cards, by the rules of poker."""
+    faces = sorted((card.face.value for card in cards), reverse=True)
+    counts = Counter(faces)
+    # Faces by how often they occur, then by face: the order they break ties.
+    ranked = sorted(counts, key=lambda face: (counts[face], face), reverse=True)
+    shape = sorted(counts.values(), reverse=True)
+    flush = len({card.suit for card in cards}) == 1
+    straight_high = 0
+    if len(counts) == 5:
+        if faces[0] - faces[4] == 4:
+            straight_high = faces[0]
+        elif faces == [14, 5, 4, 3, 2]:
+            straight_high = 5
+
+    if straight_high and flush:
+        return (9 if straight_high == 14 else 8, [straight_high])
+    if shape == [4, 1]:
+        return (7, ranked)
+    if shape == [3, 2]:
+        return (6, ranked)
+    if flush:
+        return (5, faces)
+    if straight_high:
+        return (4, [straight_high])
+    if shape == [3, 1, 1]:
+        return (3, ranked)
+    if shape == [2, 2, 1]:
+        return (2, ranked)
+    if shape == [2, 1, 1, 1]:
+        return (1, ranked)
+    return (0, faces)
+
+
+def _cards(text):
+    """Cards from a string as "As Kd 5c", faces 2-9, T, J, Q, K and A."""
+    faces = {"T": 10, "J": 11, "Q": 12, "K": 13, "A": 14}
+    return tuple(
+        Card(Card.Suit[suit], Card.Face(faces.get(face) or int(face)))
+        for face, suit in text.split()
+    )
+
+
+def _masks(cards):
+    mask, product, suits = 0, 1, 0
+    for card in cards:
+        mask |= 1 << card.code
+        product *= card.prime
+        suits += card.suit_key
+    return mask, product, suits
+
+
+class TestPokerHand(unittest.TestCase):
+
+    def test_five_cards_are_ordered_as_the_rules(self):
+        rng = random.Random(0)
+        hands = [tuple(rng.sample(ALL_CARDS, 5)) for __ in range(2000)]
+        hands += [
+            _cards("As Ks Qs Js Ts"),
+            _cards("5h 4h 3h 2h Ah"),
+            _cards("6h 5h 4h 3h 2h"),
+            _cards("5c 4d 3h 2s Ac"),
+            _cards("6c 5d 4h 3s 2c"),
+            _cards("Ac Ad Ah As 2c"),
+            _cards("2c 2d 2h As Ac"),
+        ]
+        scored = [(PokerHand(hand), _reference_key(hand)) for hand in hands]
+        for hand, key in scored:
+            self.assertEqual(hand.tier.value, key[0], hand)
+        for (hand1, key1), (hand2, key2) in zip(scored, scored[1:]):
+            self.assertEqual(
+                hand1.score < hand2.score, key1 < key2, (hand1, hand2)
+            )
+            self.assertEqual(
+                hand1.score == hand2.score, key1 == key2, (hand1, hand2)
+            )
+
+    def test_best7_is_the_best_five_card_combination(self):
+        rng = random.Random(1)
+        for n_cards in (5, 6, 7) * 700:
+            cards = tuple(rng.sample(ALL_CARDS, n_cards))
+            brute = max(PokerHand(combo).score for combo in combinations(cards, 5))
+            mask, product, suits = _masks(cards)
+            self.assertEqual(PokerHand.best7(mask, product, suits), brute, cards)
+            self.assertEqual(PokerHand.evaluate_mask(mask), brute, cards)
+            self.assertEqual(PokerHand.best(cards).score, brute, cards)
+
+    def test_best7_finds_flushes_among_seven_cards(self):
+        for text in (
+            "Ah Kh 2h 7h 9h Kd Ks",
+            "2c 3c 4c 5c Ac Ad Ah",
+            "9s Ts Js Qs Ks Kh Kd",
+            "2d 7d 8d 9d Td Jd 3c",
+        ):
+            cards = _cards(text)
+            brute = max(PokerHand(combo).score for combo in combinations(cards, 5))
+            self.assertEqual(PokerHand.best7(*_masks(cards)), brute, text)
+            self.assertGreaterEqual(brute // 1_000_000, PokerHand.Tier.FLUSH.value)
+
+
+if __name__ == "__main__":
+    unittest.main()
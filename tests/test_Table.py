@@ -0,0 +1,153 @@
+from poker.Action import Action
+from poker.Player import Player
+from poker.Strategies import (
+    ACaller,
+    AFolder,
+    Cheater,
+    CopyCat,
+    King,
+    Random,
+    Reinforcement,
+)
+from poker.Table import Table
+from poker.TableState import TableState
+
+import random
+import unittest
+
+# The table under test and whether a Cheater was handed its shared view, module
+# level so that copies of the strategies report here as well.
+_TABLE = []
+_SHARED_VIEWS = []
+
+
+class _CheckedCheater(Cheater):
+
+    def make_action(self, tablestate: TableState, me: Player) -> Action:
+        _SHARED_VIEWS.append(tablestate is _TABLE[0]._public_view)
+        return super().make_action(tablestate, me)
+
+
+def _players():
+    strategies = (Random(), King(), ACaller(), Reinforcement(), CopyCat())
+    moneys = (20, 15, 30, 10, 25)
+    return tuple(Player(money, strategy) for money, strategy in zip(moneys, strategies))
+
+
+def _bits(players, keep):
+    return sum(1 << idx for idx, play in enumerate(players) if keep(play))
+
+
+class TestTable(unittest.TestCase):
+
+    def _assert_bookkeeping(self, table):
+        """The masks and running totals of the table match its players."""
+        players = table.state.players
+        active = _bits(players, lambda play: not play.folded and play.money > 0)
+        self.assertEqual(table._folded_mask, _bits(players, lambda play: play.folded))
+        self.assertEqual(table._allin_mask, _bits(players, lambda play: play.all_in))
+        self.assertEqual(table._broke_mask, _bits(players, lambda play: not play.money))
+        self.assertEqual(table._active_mask, active)
+        self.assertEqual(table._bets, [play.bet for play in players])
+        self.assertEqual(table._pot, sum(play.bet for play in players))
+        self.assertEqual(
+            table._max_bet,
+            max((play.bet for play in players if not play.folded), default=0),
+        )
+        bet_masks = {}
+        for idx, play in enumerate(players):
+            if active >> idx & 1:
+                bet_masks[play.bet] = bet_masks.get(play.bet, 0) | 1 << idx
+        self.assertEqual(
+            {bet: mask for bet, mask in table._bet_masks.items() if mask}, bet_masks
+        )
+
+        community = table.state.cards
+        self.assertEqual(table._community_mask, sum(1 << c.code for c in community))
+        self.assertEqual(table._community_suits, sum(c.suit_key for c in community))
+        for idx, play in enumerate(players):
+            if play.cards:
+                card1, card2 = play.cards
+                self.assertEqual(
+                    table._hole_masks[idx], 1 << card1.code | 1 << card2.code
+                )
+                self.assertEqual(table._hole_products[idx], card1.prime * card2.prime)
+
+        # The ring is rebuilt lazily, it is only valid for the mask it was built for.
+        if active and table._ring_mask == active:
+            n = len(players)
+            for idx in range(n):
+                following = ((idx + step) % n for step in range(1, n + 1))
+                expected = next(nxt for nxt in following if active >> nxt & 1)
+                self.assertEqual(table._next_active[idx], expected)
+
+    def test_masks_follow_the_players_at_every_step(self):
+        for seed in (1, 2):
+            random.seed(seed)
+            table = Table.construct_withPlayers(_players())
+            while not table.done():
+                table.step()
+                self._assert_bookkeeping(table)
+
+    def test_fixed_seed_game(self):
+        random.seed(7)
+        table = Table.construct_withPlayers(_players())
+        table.run()
+        self.assertEqual([play.money for play in table.state.players], [0, 0, 0, 0, 99])
+        self.assertEqual(table.round_counter, 556)
+        self.assertIsInstance(table.getWinner().strategy, CopyCat)
+
+    def test_run_many_is_independent_of_the_number_of_workers(self):
+        table = Table.construct_withPlayers(_players())
+        single = table.run_many(8, seed=3, max_workers=1)
+        self.assertEqual(len(single), 8)
+        self.assertEqual(table.run_many(8, seed=3, max_workers=3), single)
+        self.assertNotEqual(table.run_many(8, seed=4, max_workers=1), single)
+
+    def test_copycat_adopting_a_cheater_gets_a_private_tablestate(self):
+        players = (
+            Player(1000, _CheckedCheater()),
+            Player(40, CopyCat()),
+            Player(40, ACaller()),
+        )
+        random.seed(0)
+        table = Table.construct_withPlayers(players)
+        _TABLE[:] = [table]
+        _SHARED_VIEWS.clear()
+        adopted = False
+        while not table.done():
+            table.step()
+            copycat = table.state.players[1].strategy
+            adopted = adopted or isinstance(copycat.play_as, Cheater)
+        self.assertTrue(adopted)
+        self.assertTrue(_SHARED_VIEWS)
+        self.assertFalse(any(_SHARED_VIEWS))
+        self.assertEqual(sum(play.money for play in table.state.players), 1080)
+
+    def test_copycat_plays_as_a_copy_of_the_adopted_strategy(self):
+        players = (Player(1000, Reinforcement()), Player(40, CopyCat()))
+        random.seed(0)
+        table = Table.construct_withPlayers(players)
+        copycat = table.state.players[1].strategy
+        while not table.done() and type(copycat.play_as) is AFolder:
+            table.step()
+        self.assertIsInstance(copycat.play_as, Reinforcement)
+        self.assertIsNot(copycat.play_as, table.state.players[0].strategy)
+
+    def test_reset_gives_fresh_strategies(self):
+        players = (Player(40, Reinforcement()), Player(40, CopyCat()))
+        random.seed(1)
+        table = Table.construct_withPlayers(players)
+        table.run()
+        learner = table.state.players[0].strategy
+        learner.update()
+        table.reset()
+        fresh = table.state.players[0].strategy
+        self.assertIsNot(fresh, learner)
+        self.assertNotEqual(fresh.value_map, learner.value_map)
+        self.assertEqual(fresh.value_map, Reinforcement().value_map)
+        self.assertEqual(table.state.players[1].strategy.steps, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()